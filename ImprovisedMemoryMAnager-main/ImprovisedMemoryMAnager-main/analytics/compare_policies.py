@@ -5,9 +5,10 @@ Compare allocation policies and visualize memory usage trends
 
 import sys
 import os
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.figure import Figure
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -19,95 +20,194 @@ from backend.buddy_allocator import ImprovisedMemoryManager
 # Simulation Functions
 # ============================================
 
-def simulate_workload(manager: ImprovisedMemoryManager, operations: List[Tuple]) -> dict:
+def simulate_workload(manager: ImprovisedMemoryManager, operations: List[Tuple],
+                      use_buddy: bool = True, sample_every: Optional[int] = None) -> dict:
     """
     Simulate a workload on the memory manager
     
     Args:
         manager: ImprovisedMemoryManager instance
         operations: List of (operation, process_name, size) tuples
+        use_buddy: Whether allocations use buddy system rounding
+        sample_every: Record memory state for plotting every N operations
+            (defaults to keeping about 2000 samples); the summary totals
+            still cover every operation
         
     Returns:
         Dictionary with simulation statistics
+        
+    Raises:
+        ValueError: If sample_every is less than 1
     """
+    n = len(operations)
+    if sample_every is None:
+        sample_every = max(1, n // 2000)
+    elif sample_every < 1:
+        raise ValueError(f"sample_every must be at least 1, got {sample_every}")
+    num_samples = -(-n // sample_every)
+    
+    # Compact dtypes: sizes and block counts never exceed total_memory, so
+    # int32 is enough unless the manager is larger than that
+    int_dtype = np.int32 if manager.total_memory <= np.iinfo(np.int32).max else np.int64
     stats = {
-        'used_memory': [],
-        'free_memory': [],
-        'fragmentation': [],
-        'blocks_count': [],
-        'operations': [],
+        'used_memory': np.empty(num_samples, dtype=int_dtype),
+        'free_memory': np.empty(num_samples, dtype=int_dtype),
+        'fragmentation': np.empty(num_samples, dtype=np.float32),
+        'blocks_count': np.empty(num_samples, dtype=int_dtype),
+        'operations': np.arange(0, n, sample_every),
+        'total_operations': n,
         'failed_allocations': 0,
         'successful_allocations': 0,
         'deallocations': 0,
         'compactions': 0
     }
     
+    used_memory = stats['used_memory']
+    free_memory = stats['free_memory']
+    fragmentation = stats['fragmentation']
+    blocks_count = stats['blocks_count']
+    
+    # Bind the hot-loop methods and tallies to locals to skip repeated lookups
+    allocate = manager.allocate
+    deallocate = manager.deallocate
+    compact = manager.compact
+    snapshot = manager.snapshot
+    successful_allocations = 0
+    failed_allocations = 0
+    deallocations = 0
+    compactions = 0
+    used_sum = free_sum = blocks_sum = 0
+    fragmentation_sum = max_fragmentation = 0.0
+    
     for i, operation in enumerate(operations):
         op_type = operation[0]
         
         if op_type == 'allocate':
             process_name, size = operation[1], operation[2]
-            success, msg, addr = manager.allocate(process_name, size)
+            success, msg, addr = allocate(process_name, size, use_buddy)
             
             if success:
-                stats['successful_allocations'] += 1
+                successful_allocations += 1
             else:
-                stats['failed_allocations'] += 1
+                failed_allocations += 1
         
         elif op_type == 'deallocate':
             process_name = operation[1]
-            success, msg = manager.deallocate(process_name)
+            success, msg = deallocate(process_name)
             
             if success:
-                stats['deallocations'] += 1
+                deallocations += 1
         
         elif op_type == 'compact':
-            success, msg, moved = manager.compact()
+            success, msg, moved = compact()
             if success:
-                stats['compactions'] += 1
+                compactions += 1
+        
+        # Accumulate the report totals on every operation
+        used, free, frag, nblocks = snapshot()
+        used_sum += used
+        free_sum += free
+        fragmentation_sum += frag
+        blocks_sum += nblocks
+        if frag > max_fragmentation:
+            max_fragmentation = frag
         
-        # Record current state
-        stats['used_memory'].append(manager.get_used_memory())
-        stats['free_memory'].append(manager.get_free_memory())
-        stats['fragmentation'].append(manager.get_fragmentation_ratio() * 100)
-        stats['blocks_count'].append(len(manager.blocks))
-        stats['operations'].append(i)
+        # Record current state for the plots
+        if i % sample_every == 0:
+            k = i // sample_every
+            used_memory[k] = used
+            free_memory[k] = free
+            fragmentation[k] = frag * 100
+            blocks_count[k] = nblocks
+    
+    stats['successful_allocations'] = successful_allocations
+    stats['failed_allocations'] = failed_allocations
+    stats['deallocations'] = deallocations
+    stats['compactions'] = compactions
+    stats['used_memory_sum'] = used_sum
+    stats['free_memory_sum'] = free_sum
+    stats['fragmentation_sum'] = fragmentation_sum * 100
+    stats['blocks_count_sum'] = blocks_sum
+    stats['max_fragmentation'] = max_fragmentation * 100
     
     return stats
 
 
-def generate_random_workload(num_operations: int = 100) -> List[Tuple]:
+# Operation codes produced by the workload kernel
+OP_ALLOCATE = 0
+OP_DEALLOCATE = 1
+OP_COMPACT = 2
+
+WORKLOAD_SIZES = np.array([32, 64, 128, 256, 512])
+
+
+def _workload_kernel(rands, size_idx, picks, sizes):
     """
-    Generate a random workload for testing
+    Generate an encoded random workload from pre-drawn random values
     
     Args:
-        num_operations: Number of operations to generate
+        rands: Uniform draws choosing each operation type
+        size_idx: Indices into sizes for each allocation
+        picks: Uniform draws choosing which active process to deallocate
+        sizes: Array of allocation sizes to pick from
         
     Returns:
-        List of operations
+        Tuple of (op_type, proc_idx, size) arrays
     """
-    operations = []
-    active_processes = []
+    num_operations = len(rands)
+    
+    op_type = np.empty(num_operations, dtype=np.int64)
+    proc_idx = np.full(num_operations, -1, dtype=np.int64)
+    size = np.zeros(num_operations, dtype=np.int64)
+    
+    active = []
     
     for i in range(num_operations):
         # 60% allocate, 30% deallocate, 10% compact
-        rand = np.random.random()
+        if rands[i] < 0.6 or len(active) == 0:
+            op_type[i] = OP_ALLOCATE
+            proc_idx[i] = i
+            size[i] = sizes[size_idx[i]]
+            active.append(i)
         
-        if rand < 0.6 or len(active_processes) == 0:
-            # Allocate
-            process_name = f"P{i}"
-            size = np.random.choice([32, 64, 128, 256, 512])
-            operations.append(('allocate', process_name, size))
-            active_processes.append(process_name)
+        elif rands[i] < 0.9:
+            # Order of active processes doesn't matter: swap-pop in O(1)
+            j = int(picks[i] * len(active))
+            op_type[i] = OP_DEALLOCATE
+            proc_idx[i] = active[j]
+            active[j] = active[-1]
+            active.pop()
         
-        elif rand < 0.9 and len(active_processes) > 0:
-            # Deallocate
-            process_name = np.random.choice(active_processes)
-            operations.append(('deallocate', process_name, None))
-            active_processes.remove(process_name)
+        else:
+            op_type[i] = OP_COMPACT
+    
+    return op_type, proc_idx, size
+
+
+def generate_random_workload(num_operations: int = 100) -> List[Tuple]:
+    """
+    Generate a random workload for testing
+    
+    Args:
+        num_operations: Number of operations to generate
         
+    Returns:
+        List of operations
+    """
+    # Draw every random value in three batched calls rather than per operation
+    rands = np.random.random(num_operations)
+    size_idx = np.random.randint(0, len(WORKLOAD_SIZES), num_operations)
+    picks = np.random.random(num_operations)
+    
+    op_type, proc_idx, size = _workload_kernel(rands, size_idx, picks, WORKLOAD_SIZES)
+    
+    operations = []
+    for op, proc, sz in zip(op_type.tolist(), proc_idx.tolist(), size.tolist()):
+        if op == OP_ALLOCATE:
+            operations.append(('allocate', f"P{proc}", sz))
+        elif op == OP_DEALLOCATE:
+            operations.append(('deallocate', f"P{proc}", None))
         else:
-            # Compact
             operations.append(('compact', None, None))
     
     return operations
@@ -117,48 +217,51 @@ def generate_random_workload(num_operations: int = 100) -> List[Tuple]:
 # Visualization Functions
 # ============================================
 
-def plot_memory_usage_over_time(stats: dict, title: str = "Memory Usage Over Time"):
+def plot_memory_usage_over_time(stats: dict, title: str = "Memory Usage Over Time") -> Figure:
     """
     Plot memory usage trends
     
     Args:
         stats: Statistics dictionary from simulation
         title: Plot title
+        
+    Returns:
+        Matplotlib Figure with the plots
     """
-    plt.figure(figsize=(14, 8))
+    fig = Figure(figsize=(14, 8))
     
     # Plot 1: Used vs Free Memory
-    plt.subplot(2, 2, 1)
-    plt.plot(stats['operations'], stats['used_memory'], 
-             label='Used Memory', color='#ef4444', linewidth=2)
-    plt.plot(stats['operations'], stats['free_memory'], 
-             label='Free Memory', color='#10b981', linewidth=2)
-    plt.xlabel('Operation Number')
-    plt.ylabel('Memory (KB)')
-    plt.title('Memory Usage Over Time')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
+    ax = fig.add_subplot(2, 2, 1)
+    ax.plot(stats['operations'], stats['used_memory'], 
+            label='Used Memory', color='#ef4444', linewidth=2)
+    ax.plot(stats['operations'], stats['free_memory'], 
+            label='Free Memory', color='#10b981', linewidth=2)
+    ax.set_xlabel('Operation Number')
+    ax.set_ylabel('Memory (KB)')
+    ax.set_title('Memory Usage Over Time')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
     
     # Plot 2: Fragmentation
-    plt.subplot(2, 2, 2)
-    plt.plot(stats['operations'], stats['fragmentation'], 
-             color='#f59e0b', linewidth=2)
-    plt.xlabel('Operation Number')
-    plt.ylabel('Fragmentation (%)')
-    plt.title('Memory Fragmentation')
-    plt.grid(True, alpha=0.3)
+    ax = fig.add_subplot(2, 2, 2)
+    ax.plot(stats['operations'], stats['fragmentation'], 
+            color='#f59e0b', linewidth=2)
+    ax.set_xlabel('Operation Number')
+    ax.set_ylabel('Fragmentation (%)')
+    ax.set_title('Memory Fragmentation')
+    ax.grid(True, alpha=0.3)
     
     # Plot 3: Number of Blocks
-    plt.subplot(2, 2, 3)
-    plt.plot(stats['operations'], stats['blocks_count'], 
-             color='#6366f1', linewidth=2)
-    plt.xlabel('Operation Number')
-    plt.ylabel('Number of Blocks')
-    plt.title('Memory Block Count')
-    plt.grid(True, alpha=0.3)
+    ax = fig.add_subplot(2, 2, 3)
+    ax.plot(stats['operations'], stats['blocks_count'], 
+            color='#6366f1', linewidth=2)
+    ax.set_xlabel('Operation Number')
+    ax.set_ylabel('Number of Blocks')
+    ax.set_title('Memory Block Count')
+    ax.grid(True, alpha=0.3)
     
     # Plot 4: Operation Statistics
-    plt.subplot(2, 2, 4)
+    ax = fig.add_subplot(2, 2, 4)
     operations_data = [
         stats['successful_allocations'],
         stats['failed_allocations'],
@@ -169,107 +272,158 @@ def plot_memory_usage_over_time(stats: dict, title: str = "Memory Usage Over Tim
                         'Deallocations', 'Compactions']
     colors = ['#10b981', '#ef4444', '#f59e0b', '#6366f1']
     
-    plt.bar(operations_labels, operations_data, color=colors)
-    plt.ylabel('Count')
-    plt.title('Operation Statistics')
-    plt.grid(True, alpha=0.3, axis='y')
+    ax.bar(operations_labels, operations_data, color=colors)
+    ax.set_ylabel('Count')
+    ax.set_title('Operation Statistics')
+    ax.grid(True, alpha=0.3, axis='y')
+    
+    fig.suptitle(title, fontsize=16, fontweight='bold')
+    fig.tight_layout()
     
-    plt.suptitle(title, fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    return fig
 
 
-def plot_comparison(buddy_stats: dict, no_buddy_stats: dict):
+def plot_comparison(buddy_stats: dict, no_buddy_stats: dict, cache: Optional[dict] = None) -> Figure:
     """
     Compare buddy system vs non-buddy allocation
     
     Args:
         buddy_stats: Statistics with buddy system
         no_buddy_stats: Statistics without buddy system
+        cache: Caller-owned dict for repeat plotting; later calls with the
+            same dict update and return the same Figure in place
+        
+    Returns:
+        Matplotlib Figure with the plots
     """
-    plt.figure(figsize=(14, 6))
-    
-    # Plot 1: Fragmentation Comparison
-    plt.subplot(1, 2, 1)
-    plt.plot(buddy_stats['operations'], buddy_stats['fragmentation'], 
-             label='With Buddy System', color='#6366f1', linewidth=2)
-    plt.plot(no_buddy_stats['operations'], no_buddy_stats['fragmentation'], 
-             label='Without Buddy System', color='#ef4444', linewidth=2)
-    plt.xlabel('Operation Number')
-    plt.ylabel('Fragmentation (%)')
-    plt.title('Fragmentation: Buddy vs Non-Buddy')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    # Plot 2: Success Rate Comparison
-    plt.subplot(1, 2, 2)
-    categories = ['With Buddy', 'Without Buddy']
+    if cache is None:
+        cache = {}
+    
+    if 'comparison' not in cache:
+        fig = Figure(figsize=(14, 6))
+        
+        # Plot 1: Fragmentation Comparison
+        frag_ax = fig.add_subplot(1, 2, 1)
+        buddy_line, = frag_ax.plot([], [], label='With Buddy System', 
+                                   color='#6366f1', linewidth=2)
+        no_buddy_line, = frag_ax.plot([], [], label='Without Buddy System', 
+                                      color='#ef4444', linewidth=2)
+        frag_ax.set_xlabel('Operation Number')
+        frag_ax.set_ylabel('Fragmentation (%)')
+        frag_ax.set_title('Fragmentation: Buddy vs Non-Buddy')
+        frag_ax.legend()
+        frag_ax.grid(True, alpha=0.3)
+        
+        # Plot 2: Success Rate Comparison
+        rate_ax = fig.add_subplot(1, 2, 2)
+        categories = ['With Buddy', 'Without Buddy']
+        x = np.arange(len(categories))
+        width = 0.35
+        
+        successful_bars = rate_ax.bar(x - width/2, [0, 0], width, 
+                                      label='Successful', color='#10b981')
+        failed_bars = rate_ax.bar(x + width/2, [0, 0], width, 
+                                  label='Failed', color='#ef4444')
+        
+        rate_ax.set_xlabel('Allocation Strategy')
+        rate_ax.set_ylabel('Number of Allocations')
+        rate_ax.set_title('Allocation Success Rate')
+        rate_ax.set_xticks(x, categories)
+        rate_ax.legend()
+        rate_ax.grid(True, alpha=0.3, axis='y')
+        
+        fig.suptitle('Buddy System vs Non-Buddy Comparison', 
+                     fontsize=16, fontweight='bold')
+        
+        cache['comparison'] = (fig, frag_ax, rate_ax, buddy_line, no_buddy_line,
+                                    successful_bars, failed_bars)
+    
+    (fig, frag_ax, rate_ax, buddy_line, no_buddy_line,
+     successful_bars, failed_bars) = cache['comparison']
+    
+    buddy_line.set_data(buddy_stats['operations'], buddy_stats['fragmentation'])
+    no_buddy_line.set_data(no_buddy_stats['operations'], no_buddy_stats['fragmentation'])
+    
     successful = [buddy_stats['successful_allocations'], 
                   no_buddy_stats['successful_allocations']]
     failed = [buddy_stats['failed_allocations'], 
               no_buddy_stats['failed_allocations']]
+    for bar, height in zip(successful_bars, successful):
+        bar.set_height(height)
+    for bar, height in zip(failed_bars, failed):
+        bar.set_height(height)
     
-    x = np.arange(len(categories))
-    width = 0.35
-    
-    plt.bar(x - width/2, successful, width, label='Successful', color='#10b981')
-    plt.bar(x + width/2, failed, width, label='Failed', color='#ef4444')
+    for ax in (frag_ax, rate_ax):
+        ax.relim()
+        ax.autoscale_view()
     
-    plt.xlabel('Allocation Strategy')
-    plt.ylabel('Number of Allocations')
-    plt.title('Allocation Success Rate')
-    plt.xticks(x, categories)
-    plt.legend()
-    plt.grid(True, alpha=0.3, axis='y')
+    fig.tight_layout()
+    fig.canvas.draw_idle()
     
-    plt.suptitle('Buddy System vs Non-Buddy Comparison', 
-                 fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    return fig
 
 
-def plot_memory_state_snapshot(manager: ImprovisedMemoryManager, title: str = "Memory State"):
+def plot_memory_state_snapshot(manager: ImprovisedMemoryManager, title: str = "Memory State") -> Figure:
     """
     Visualize current memory state as a bar chart
     
     Args:
         manager: ImprovisedMemoryManager instance
         title: Plot title
+        
+    Returns:
+        Matplotlib Figure with the plot
     """
-    plt.figure(figsize=(12, 4))
+    fig = Figure(figsize=(12, 4))
+    ax = fig.add_subplot()
     
     blocks = manager.blocks
-    colors = []
-    labels = []
-    sizes = []
-    
-    for block in blocks:
-        if block.is_free:
-            colors.append('#94a3b8')
-            labels.append(f'FREE\n{block.size}KB')
-        else:
-            colors.append('#6366f1')
-            labels.append(f'{block.process_name}\n{block.size}KB')
-        sizes.append(block.size)
-    
-    # Create horizontal bar
-    left = 0
-    for i, size in enumerate(sizes):
-        plt.barh(0, size, left=left, height=0.5, 
-                color=colors[i], edgecolor='white', linewidth=2)
-        
-        # Add label
-        if size > 50:  # Only show label if block is large enough
-            plt.text(left + size/2, 0, labels[i], 
-                    ha='center', va='center', fontsize=8, fontweight='bold')
-        
-        left += size
+    n = len(blocks)
+    sizes = np.fromiter((block.size for block in blocks), dtype=np.int64, count=n)
+    is_free = np.fromiter((block.is_free for block in blocks), dtype=bool, count=n)
+    
+    # Block start addresses as a cumulative sum of the preceding sizes
+    starts = np.zeros_like(sizes)
+    np.cumsum(sizes[:-1], out=starts[1:])
+    
+    colors = np.where(is_free, '#94a3b8', '#6366f1')
+    
+    # Create horizontal bar with a single collection for all blocks
+    ax.broken_barh(np.column_stack((starts, sizes)), (-0.25, 0.5), 
+                   facecolors=colors, edgecolor='white', linewidth=2)
+    
+    # Add labels only where the block is large enough
+    for i in np.flatnonzero(sizes > 50):
+        block = blocks[i]
+        name = 'FREE' if block.is_free else block.process_name
+        ax.text(starts[i] + sizes[i]/2, 0, f'{name}\n{block.size}KB', 
+                ha='center', va='center', fontsize=8, fontweight='bold')
+    
+    ax.set_xlim(0, manager.total_memory)
+    ax.set_ylim(-0.5, 0.5)
+    ax.set_xlabel('Memory Address (KB)')
+    ax.set_title(title)
+    ax.set_yticks([])
+    ax.grid(True, alpha=0.3, axis='x')
+    fig.tight_layout()
+    
+    return fig
+
+
+def render_figure(job: Tuple) -> str:
+    """
+    Build a figure and save it as a PNG (runs in a worker process)
     
-    plt.xlim(0, manager.total_memory)
-    plt.ylim(-0.5, 0.5)
-    plt.xlabel('Memory Address (KB)')
-    plt.title(title)
-    plt.yticks([])
-    plt.grid(True, alpha=0.3, axis='x')
-    plt.tight_layout()
+    Args:
+        job: Tuple of (plot_function, args, out_path)
+        
+    Returns:
+        Path of the saved image
+    """
+    plot_function, args, out_path = job
+    fig = plot_function(*args)
+    fig.savefig(out_path, dpi=300, bbox_inches='tight')
+    return out_path
 
 
 # ============================================
@@ -286,14 +440,31 @@ def analyze_performance(stats: dict) -> dict:
     Returns:
         Dictionary with performance metrics
     """
-    total_ops = len(stats['operations'])
+    total_ops = stats.get('total_operations', len(stats['operations']))
+    
+    if 'fragmentation_sum' in stats:
+        # Totals over every operation; the arrays may only hold samples
+        n = max(total_ops, 1)
+        averages = {
+            'average_used_memory': stats['used_memory_sum'] / n,
+            'average_free_memory': stats['free_memory_sum'] / n,
+            'average_fragmentation': stats['fragmentation_sum'] / n,
+            'max_fragmentation': stats['max_fragmentation'],
+            'average_blocks': stats['blocks_count_sum'] / n
+        }
+    else:
+        # Zero-copy views over the statistics arrays
+        fragmentation = np.asarray(stats['fragmentation'])
+        averages = {
+            'average_used_memory': float(np.asarray(stats['used_memory']).mean()),
+            'average_free_memory': float(np.asarray(stats['free_memory']).mean()),
+            'average_fragmentation': float(fragmentation.mean()),
+            'max_fragmentation': float(fragmentation.max()),
+            'average_blocks': float(np.asarray(stats['blocks_count']).mean())
+        }
     
     metrics = {
-        'average_used_memory': np.mean(stats['used_memory']),
-        'average_free_memory': np.mean(stats['free_memory']),
-        'average_fragmentation': np.mean(stats['fragmentation']),
-        'max_fragmentation': np.max(stats['fragmentation']),
-        'average_blocks': np.mean(stats['blocks_count']),
+        **averages,
         'allocation_success_rate': (stats['successful_allocations'] / 
                                    (stats['successful_allocations'] + stats['failed_allocations']) * 100
                                    if (stats['successful_allocations'] + stats['failed_allocations']) > 0 else 0),
@@ -362,88 +533,40 @@ def main():
     buddy_metrics = analyze_performance(buddy_stats)
     print_performance_report(buddy_metrics, "WITH BUDDY SYSTEM")
     
-    # Test 2: Without Buddy System (modify allocate to not use buddy)
+    # Test 2: Without Buddy System
     print("🔄 Running simulation without Buddy System...")
     manager_no_buddy = ImprovisedMemoryManager(2048)
-    # Modify operations to disable buddy
-    operations_no_buddy = []
-    for op in operations:
-        if op[0] == 'allocate':
-            operations_no_buddy.append(('allocate_no_buddy', op[1], op[2]))
-        else:
-            operations_no_buddy.append(op)
-    
-    # Custom simulation for no buddy
-    no_buddy_stats = {
-        'used_memory': [],
-        'free_memory': [],
-        'fragmentation': [],
-        'blocks_count': [],
-        'operations': [],
-        'failed_allocations': 0,
-        'successful_allocations': 0,
-        'deallocations': 0,
-        'compactions': 0
-    }
-    
-    for i, operation in enumerate(operations_no_buddy):
-        op_type = operation[0]
-        
-        if op_type == 'allocate_no_buddy':
-            process_name, size = operation[1], operation[2]
-            success, msg, addr = manager_no_buddy.allocate(process_name, size, use_buddy=False)
-            
-            if success:
-                no_buddy_stats['successful_allocations'] += 1
-            else:
-                no_buddy_stats['failed_allocations'] += 1
-        
-        elif op_type == 'deallocate':
-            process_name = operation[1]
-            success, msg = manager_no_buddy.deallocate(process_name)
-            
-            if success:
-                no_buddy_stats['deallocations'] += 1
-        
-        elif op_type == 'compact':
-            success, msg, moved = manager_no_buddy.compact()
-            if success:
-                no_buddy_stats['compactions'] += 1
-        
-        no_buddy_stats['used_memory'].append(manager_no_buddy.get_used_memory())
-        no_buddy_stats['free_memory'].append(manager_no_buddy.get_free_memory())
-        no_buddy_stats['fragmentation'].append(manager_no_buddy.get_fragmentation_ratio() * 100)
-        no_buddy_stats['blocks_count'].append(len(manager_no_buddy.blocks))
-        no_buddy_stats['operations'].append(i)
-    
+    no_buddy_stats = simulate_workload(manager_no_buddy, operations, use_buddy=False)
     no_buddy_metrics = analyze_performance(no_buddy_stats)
     print_performance_report(no_buddy_metrics, "WITHOUT BUDDY SYSTEM")
     
     # Generate visualizations
     print("📈 Generating visualizations...")
     
-    plot_memory_usage_over_time(buddy_stats, "Memory Manager Performance - WITH Buddy System")
-    plt.savefig('analytics_buddy_system.png', dpi=300, bbox_inches='tight')
-    print("✅ Saved: analytics_buddy_system.png")
-    
-    plot_memory_usage_over_time(no_buddy_stats, "Memory Manager Performance - WITHOUT Buddy System")
-    plt.savefig('analytics_no_buddy.png', dpi=300, bbox_inches='tight')
-    print("✅ Saved: analytics_no_buddy.png")
-    
-    plot_comparison(buddy_stats, no_buddy_stats)
-    plt.savefig('analytics_comparison.png', dpi=300, bbox_inches='tight')
-    print("✅ Saved: analytics_comparison.png")
-    
-    plot_memory_state_snapshot(manager_buddy, "Memory State Snapshot - WITH Buddy System")
-    plt.savefig('memory_state_buddy.png', dpi=300, bbox_inches='tight')
-    print("✅ Saved: memory_state_buddy.png")
+    jobs = [
+        (plot_memory_usage_over_time,
+         (buddy_stats, "Memory Manager Performance - WITH Buddy System"),
+         'analytics_buddy_system.png'),
+        (plot_memory_usage_over_time,
+         (no_buddy_stats, "Memory Manager Performance - WITHOUT Buddy System"),
+         'analytics_no_buddy.png'),
+        (plot_comparison,
+         (buddy_stats, no_buddy_stats),
+         'analytics_comparison.png'),
+        (plot_memory_state_snapshot,
+         (manager_buddy, "Memory State Snapshot - WITH Buddy System"),
+         'memory_state_buddy.png'),
+        (plot_memory_state_snapshot,
+         (manager_no_buddy, "Memory State Snapshot - WITHOUT Buddy System"),
+         'memory_state_no_buddy.png'),
+    ]
     
-    plot_memory_state_snapshot(manager_no_buddy, "Memory State Snapshot - WITHOUT Buddy System")
-    plt.savefig('memory_state_no_buddy.png', dpi=300, bbox_inches='tight')
-    print("✅ Saved: memory_state_no_buddy.png")
+    # Rasterizing at 300 dpi is CPU-bound, so render the figures in parallel
+    with ProcessPoolExecutor() as executor:
+        for path in executor.map(render_figure, jobs):
+            print(f"✅ Saved: {path}")
     
     print("\n✨ All analytics complete! Check the generated PNG files.\n")
-    plt.show()
 
 
 if __name__ == "__main__":
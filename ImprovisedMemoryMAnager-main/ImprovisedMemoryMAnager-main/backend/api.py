@@ -5,6 +5,7 @@ Provides REST API endpoints for memory management operations
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional
 import uvicorn
@@ -49,7 +50,8 @@ class MemoryResponse(BaseModel):
 app = FastAPI(
     title="Improvised Memory Manager API",
     description="REST API for memory allocation, deallocation, and compaction",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for frontend communication
@@ -64,6 +66,24 @@ app.add_middleware(
 # Global memory manager instance
 memory_manager: Optional[ImprovisedMemoryManager] = None
 
+# Last computed status, refreshed only when memory is mutated
+_status_cache: Optional[dict] = None
+
+
+def _refresh_status() -> dict:
+    """
+    Recompute the memory status after a mutation and cache it for /status
+    
+    Returns:
+        Current memory status
+    """
+    global _status_cache
+    
+    status = memory_manager.get_status()
+    status["initialized"] = True
+    _status_cache = status
+    return status
+
 
 # ============================================
 # API Endpoints
@@ -102,9 +122,9 @@ async def initialize_memory(request: InitializeRequest):
     
     try:
         memory_manager = ImprovisedMemoryManager(request.total_memory)
-        status = memory_manager.get_status()
+        status = _refresh_status()
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": f"Memory initialized with {request.total_memory} KB",
             "blocks": status["blocks"],
@@ -112,7 +132,7 @@ async def initialize_memory(request: InitializeRequest):
             "used_memory": status["used_memory"],
             "free_memory": status["free_memory"],
             "fragmentation": status["fragmentation"]
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -138,9 +158,9 @@ async def allocate_process(request: AllocateRequest):
             request.use_buddy
         )
         
-        status = memory_manager.get_status()
+        status = _refresh_status()
         
-        return {
+        return ORJSONResponse({
             "success": success,
             "message": message,
             "start_address": start_address,
@@ -149,7 +169,7 @@ async def allocate_process(request: AllocateRequest):
             "free_memory": status["free_memory"],
             "total_memory": status["total_memory"],
             "fragmentation": status["fragmentation"]
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -170,9 +190,9 @@ async def deallocate_process(request: DeallocateRequest):
     
     try:
         success, message = memory_manager.deallocate(request.process_name)
-        status = memory_manager.get_status()
+        status = _refresh_status()
         
-        return {
+        return ORJSONResponse({
             "success": success,
             "message": message,
             "blocks": status["blocks"],
@@ -180,7 +200,7 @@ async def deallocate_process(request: DeallocateRequest):
             "free_memory": status["free_memory"],
             "total_memory": status["total_memory"],
             "fragmentation": status["fragmentation"]
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -198,9 +218,9 @@ async def compact_memory():
     
     try:
         success, message, moved = memory_manager.compact()
-        status = memory_manager.get_status()
+        status = _refresh_status()
         
-        return {
+        return ORJSONResponse({
             "success": success,
             "message": message,
             "moved_processes": moved,
@@ -209,7 +229,7 @@ async def compact_memory():
             "free_memory": status["free_memory"],
             "total_memory": status["total_memory"],
             "fragmentation": status["fragmentation"]
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -235,9 +255,8 @@ async def get_status():
         }
     
     try:
-        status = memory_manager.get_status()
-        status["initialized"] = True
-        return status
+        status = _status_cache if _status_cache is not None else _refresh_status()
+        return ORJSONResponse(status)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -258,16 +277,16 @@ async def reset_memory(total_memory: Optional[int] = None):
     
     try:
         memory_manager.reset(total_memory)
-        status = memory_manager.get_status()
+        status = _refresh_status()
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "message": "Memory reset successfully",
             "blocks": status["blocks"],
             "total_memory": status["total_memory"],
             "used_memory": status["used_memory"],
             "free_memory": status["free_memory"]
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
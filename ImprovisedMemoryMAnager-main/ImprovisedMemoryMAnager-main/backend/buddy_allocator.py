@@ -3,18 +3,24 @@ Improvised Memory Manager - Buddy System with Best-Fit Allocation
 Combines buddy system principles with best-fit allocation and compaction
 """
 
-import math
-from typing import List, Dict, Optional, Tuple
+import copy
+import sys
+from bisect import bisect_left, insort
+from typing import List, Dict, NamedTuple, Optional, Tuple
 
 
 class MemoryBlock:
-    """Represents a block of memory"""
+    """Represents a block of memory (a node in the manager's address-ordered list)"""
+    
+    __slots__ = ("start", "size", "is_free", "process_name", "prev", "next")
     
     def __init__(self, start: int, size: int, is_free: bool = True, process_name: str = None):
         self.start = start
         self.size = size
         self.is_free = is_free
         self.process_name = process_name
+        self.prev: Optional["MemoryBlock"] = None
+        self.next: Optional["MemoryBlock"] = None
     
     @property
     def end(self) -> int:
@@ -31,11 +37,29 @@ class MemoryBlock:
             "end": self.end
         }
     
+    def __getstate__(self) -> Tuple:
+        """Pickle block fields only; the owning manager restores the links"""
+        return self.start, self.size, self.is_free, self.process_name
+    
+    def __setstate__(self, state: Tuple):
+        """Restore block fields from a pickle, unlinked"""
+        self.start, self.size, self.is_free, self.process_name = state
+        self.prev = None
+        self.next = None
+    
     def __repr__(self):
         status = "FREE" if self.is_free else f"ALLOCATED({self.process_name})"
         return f"Block[{self.start}-{self.end}]: {self.size}KB {status}"
 
 
+class MemorySnapshot(NamedTuple):
+    """Point-in-time memory statistics"""
+    used_memory: int
+    free_memory: int
+    fragmentation: float
+    blocks_count: int
+
+
 class ImprovisedMemoryManager:
     """
     Improvised Memory Manager combining:
@@ -52,30 +76,92 @@ class ImprovisedMemoryManager:
             total_memory: Total memory size in KB
         """
         self.total_memory = total_memory
-        self.blocks: List[MemoryBlock] = []
+        # Blocks form a doubly-linked list between two sentinels, in address order
+        self._head: Optional[MemoryBlock] = None
+        self._tail: Optional[MemoryBlock] = None
         self.process_map: Dict[str, MemoryBlock] = {}
+        # Segregated free lists: bin k holds free blocks with 2**(k-1) < size <= 2**k
+        # as sorted (size, start, id(block), block) entries; id() breaks ties between
+        # zero-size blocks sharing a start; bit k of _bin_mask marks a non-empty bin
+        self._free_bins: List[List[Tuple[int, int, int, MemoryBlock]]] = []
+        self._bin_mask = 0
+        # Aggregates maintained incrementally by allocate/deallocate/compact
+        self._used = 0
+        self._num_free_blocks = 0
+        self._block_count = 0
         self._initialize_memory()
     
     def _initialize_memory(self):
         """Initialize memory with a single free block"""
-        self.blocks = [MemoryBlock(0, self.total_memory, is_free=True)]
+        self._new_block_list()
+        initial_block = MemoryBlock(0, self.total_memory, is_free=True)
+        self._link_after(self._head, initial_block)
+        self._block_count = 1
         self.process_map = {}
+        self._reset_free_bins()
+        self._add_free_block(initial_block)
+        self._used = 0
+        self._num_free_blocks = 1
     
-    def _round_to_power_of_2(self, size: int) -> int:
-        """
-        Round size up to nearest power of 2 (buddy system style)
-        
-        Args:
-            size: Original size
-            
-        Returns:
-            Rounded size (power of 2)
-        """
-        if size <= 0:
-            return 1
-        return 2 ** math.ceil(math.log2(size))
+    def _new_block_list(self):
+        """Start an empty block list bounded by head and tail sentinels"""
+        # Sentinels are never free, so coalescing stops at them
+        self._head = MemoryBlock(0, 0, is_free=False)
+        self._tail = MemoryBlock(self.total_memory, 0, is_free=False)
+        self._head.next = self._tail
+        self._tail.prev = self._head
+    
+    @staticmethod
+    def _link_after(block: MemoryBlock, new_block: MemoryBlock):
+        """Insert new_block into the list right after block"""
+        new_block.prev = block
+        new_block.next = block.next
+        block.next.prev = new_block
+        block.next = new_block
+    
+    @staticmethod
+    def _unlink(block: MemoryBlock):
+        """Remove block from the list"""
+        block.prev.next = block.next
+        block.next.prev = block.prev
+        block.prev = None
+        block.next = None
+    
+    @property
+    def blocks(self) -> List[MemoryBlock]:
+        """All blocks in address order"""
+        blocks = []
+        block = self._head.next
+        while block is not self._tail:
+            blocks.append(block)
+            block = block.next
+        return blocks
+    
+    def _reset_free_bins(self):
+        """Empty the segregated free lists"""
+        self._free_bins = [[] for _ in range(self.total_memory.bit_length() + 1)]
+        self._bin_mask = 0
+    
+    @staticmethod
+    def _bin_of(size: int) -> int:
+        """Free-list bin for a block size: ceil(log2(size))"""
+        return (size - 1).bit_length() if size > 0 else 0
+    
+    def _add_free_block(self, block: MemoryBlock):
+        """Add a free block to its size bin"""
+        k = self._bin_of(block.size)
+        insort(self._free_bins[k], (block.size, block.start, id(block), block))
+        self._bin_mask |= 1 << k
     
-    def _find_best_fit(self, size: int) -> Optional[int]:
+    def _remove_free_block(self, block: MemoryBlock):
+        """Remove a free block from its size bin (before resizing it)"""
+        k = self._bin_of(block.size)
+        free_bin = self._free_bins[k]
+        del free_bin[bisect_left(free_bin, (block.size, block.start, id(block)))]
+        if not free_bin:
+            self._bin_mask &= ~(1 << k)
+    
+    def _find_best_fit(self, size: int) -> Optional[MemoryBlock]:
         """
         Find the best-fit free block for the given size
         
@@ -83,18 +169,24 @@ class ImprovisedMemoryManager:
             size: Required size
             
         Returns:
-            Index of best-fit block or None if not found
+            Smallest free block that fits (lowest address on ties) or None if not found
         """
-        best_idx = None
-        best_size = float('inf')
+        k = self._bin_of(size)
+        if k >= len(self._free_bins):
+            return None
         
-        for idx, block in enumerate(self.blocks):
-            if block.is_free and block.size >= size:
-                if block.size < best_size:
-                    best_size = block.size
-                    best_idx = idx
+        # The request's own bin may hold blocks both smaller and larger than it
+        free_bin = self._free_bins[k]
+        idx = bisect_left(free_bin, (size,))
+        if idx < len(free_bin):
+            return free_bin[idx][3]
         
-        return best_idx
+        # Otherwise the smallest block of the next non-empty bin is the best fit
+        higher = self._bin_mask >> (k + 1)
+        if not higher:
+            return None
+        j = k + (higher & -higher).bit_length()
+        return self._free_bins[j][0][3]
     
     def allocate(self, process_name: str, size: int, use_buddy: bool = True) -> Tuple[bool, str, Optional[int]]:
         """
@@ -108,40 +200,48 @@ class ImprovisedMemoryManager:
         Returns:
             Tuple of (success, message, start_address)
         """
+        # Store interned keys so callers passing literal or interned names hit
+        # process_map by identity; only exact str can be interned
+        if type(process_name) is str:
+            process_name = sys.intern(process_name)
+        
         # Check if process already exists
         if process_name in self.process_map:
             return False, f"Process '{process_name}' already allocated", None
         
-        # Round to power of 2 if using buddy system
-        actual_size = self._round_to_power_of_2(size) if use_buddy else size
+        # Round up to power of 2 if using buddy system (integer bit trick, no float log2)
+        if use_buddy:
+            actual_size = 1 if size <= 1 else 1 << (size - 1).bit_length()
+        else:
+            actual_size = size
         
         # Find best-fit block
-        best_idx = self._find_best_fit(actual_size)
+        block = self._find_best_fit(actual_size)
         
-        if best_idx is None:
+        if block is None:
             return False, "No suitable free block found. Try compaction.", None
         
-        # Get the block
-        block = self.blocks[best_idx]
         start_address = block.start
+        self._remove_free_block(block)
         
         # Split the block if it's larger than needed
         if block.size > actual_size:
-            # Create allocated block
-            allocated_block = MemoryBlock(block.start, actual_size, is_free=False, process_name=process_name)
-            # Create remaining free block
+            # Link the remaining free space in right after the allocated part
             remaining_block = MemoryBlock(block.start + actual_size, block.size - actual_size, is_free=True)
-            
-            # Replace the original block with split blocks
-            self.blocks[best_idx] = allocated_block
-            self.blocks.insert(best_idx + 1, remaining_block)
+            self._link_after(block, remaining_block)
+            self._add_free_block(remaining_block)
+            self._block_count += 1
+            block.size = actual_size
         else:
             # Use the entire block
-            block.is_free = False
-            block.process_name = process_name
+            self._num_free_blocks -= 1
+        
+        block.is_free = False
+        block.process_name = process_name
+        self._used += actual_size
         
         # Add to process map
-        self.process_map[process_name] = self.blocks[best_idx]
+        self.process_map[process_name] = block
         
         return True, f"Process '{process_name}' allocated {actual_size}KB", start_address
     
@@ -158,45 +258,49 @@ class ImprovisedMemoryManager:
         if process_name not in self.process_map:
             return False, f"Process '{process_name}' not found"
         
-        # Find and free the block
-        for block in self.blocks:
-            if not block.is_free and block.process_name == process_name:
-                block.is_free = True
-                block.process_name = None
-                break
+        # Free the block and remove it from the process map
+        block = self.process_map.pop(process_name)
+        block.is_free = True
+        block.process_name = None
+        self._used -= block.size
+        self._num_free_blocks += 1
         
-        # Remove from process map
-        del self.process_map[process_name]
-        
-        # Merge adjacent free blocks
-        self._merge_free_blocks()
+        # Merge with adjacent free blocks, if there are any
+        if block.prev.is_free or block.next.is_free:
+            self._merge_free_blocks(block)
+        else:
+            self._add_free_block(block)
         
         return True, f"Process '{process_name}' deallocated"
     
-    def _merge_free_blocks(self):
-        """Merge adjacent free blocks to reduce fragmentation"""
-        if len(self.blocks) <= 1:
-            return
+    def _merge_free_blocks(self, block: MemoryBlock):
+        """
+        Merge a newly freed block with its free neighbours to reduce fragmentation
         
-        merged = []
-        i = 0
+        Only the two neighbours can be free, since free blocks are always
+        kept coalesced. The surviving block is added to the free index.
         
-        while i < len(self.blocks):
-            current = self.blocks[i]
-            
-            # Look ahead to merge consecutive free blocks
-            if current.is_free:
-                j = i + 1
-                while j < len(self.blocks) and self.blocks[j].is_free:
-                    current.size += self.blocks[j].size
-                    j += 1
-                i = j
-            else:
-                i += 1
-            
-            merged.append(current)
+        Args:
+            block: Newly freed block (not yet in the free index)
+        """
+        following = block.next
+        if following.is_free:
+            self._remove_free_block(following)
+            block.size += following.size
+            self._unlink(following)
+            self._num_free_blocks -= 1
+            self._block_count -= 1
+        
+        preceding = block.prev
+        if preceding.is_free:
+            self._remove_free_block(preceding)
+            preceding.size += block.size
+            self._unlink(block)
+            self._num_free_blocks -= 1
+            self._block_count -= 1
+            block = preceding
         
-        self.blocks = merged
+        self._add_free_block(block)
     
     def compact(self) -> Tuple[bool, str, int]:
         """
@@ -205,46 +309,54 @@ class ImprovisedMemoryManager:
         Returns:
             Tuple of (success, message, moved_count)
         """
-        allocated_blocks = [b for b in self.blocks if not b.is_free]
-        
-        if not allocated_blocks:
+        if not self.process_map:
             return False, "No allocated blocks to compact", 0
         
-        # Create new block list
-        new_blocks = []
-        current_address = 0
+        # Free blocks are always coalesced, so the layout is already compact when
+        # there is no hole, or the only hole is the last block
+        if self._num_free_blocks == 0 or (self._num_free_blocks == 1 and self._tail.prev.is_free):
+            return True, "Memory already compacted", 0
         
-        # Place all allocated blocks contiguously
-        for block in allocated_blocks:
-            new_block = MemoryBlock(
-                current_address,
-                block.size,
-                is_free=False,
-                process_name=block.process_name
-            )
-            new_blocks.append(new_block)
-            
-            # Update process map
-            self.process_map[block.process_name] = new_block
-            
-            current_address += block.size
+        # Slide allocated blocks down in place and drop the free ones;
+        # process_map keeps pointing at the same block objects
+        current_address = 0
+        spare = None
+        block = self._head.next
+        while block is not self._tail:
+            following = block.next
+            if block.is_free:
+                self._unlink(block)
+                if spare is None:
+                    spare = block
+            else:
+                block.start = current_address
+                current_address += block.size
+            block = following
         
         # Add single free block at the end
         free_space = self.total_memory - current_address
+        self._reset_free_bins()
         if free_space > 0:
-            new_blocks.append(MemoryBlock(current_address, free_space, is_free=True))
+            if spare is None:
+                spare = MemoryBlock(current_address, free_space, is_free=True)
+            else:
+                spare.start = current_address
+                spare.size = free_space
+            self._link_after(self._tail.prev, spare)
+            self._add_free_block(spare)
         
-        self.blocks = new_blocks
+        self._num_free_blocks = 1 if free_space > 0 else 0
+        self._block_count = len(self.process_map) + self._num_free_blocks
         
-        return True, f"Memory compacted successfully", len(allocated_blocks)
+        return True, f"Memory compacted successfully", len(self.process_map)
     
     def get_used_memory(self) -> int:
         """Get total used memory"""
-        return sum(block.size for block in self.blocks if not block.is_free)
+        return self._used
     
     def get_free_memory(self) -> int:
         """Get total free memory"""
-        return sum(block.size for block in self.blocks if block.is_free)
+        return self.total_memory - self._used
     
     def get_fragmentation_ratio(self) -> float:
         """
@@ -253,26 +365,84 @@ class ImprovisedMemoryManager:
         Returns:
             Fragmentation ratio (0-1)
         """
-        free_blocks = [b for b in self.blocks if b.is_free]
-        if len(free_blocks) <= 1:
+        if self._num_free_blocks <= 1:
             return 0.0
-        return (len(free_blocks) - 1) / len(self.blocks)
+        return (self._num_free_blocks - 1) / self._block_count
     
-    def get_status(self) -> Dict:
+    def snapshot(self) -> MemorySnapshot:
+        """
+        Collect memory statistics from the cached aggregates
+        
+        Returns:
+            MemorySnapshot of (used_memory, free_memory, fragmentation, blocks_count)
+        """
+        return MemorySnapshot(
+            self._used,
+            self.total_memory - self._used,
+            self.get_fragmentation_ratio(),
+            self._block_count
+        )
+    
+    def get_status(self, include_blocks: bool = True) -> Dict:
         """
         Get current memory status
         
+        Args:
+            include_blocks: Whether to include the serialized block list
+            
         Returns:
             Dictionary with memory statistics
         """
-        return {
+        status = {
             "total_memory": self.total_memory,
-            "used_memory": self.get_used_memory(),
-            "free_memory": self.get_free_memory(),
-            "blocks": [block.to_dict() for block in self.blocks],
-            "active_processes": len(self.process_map),
-            "fragmentation": round(self.get_fragmentation_ratio() * 100, 2)
+            "used_memory": self._used,
+            "free_memory": self.total_memory - self._used
         }
+        
+        if include_blocks:
+            # Build the block dicts inline rather than through to_dict()/end per block
+            status["blocks"] = [
+                {
+                    "start": b.start,
+                    "size": b.size,
+                    "is_free": b.is_free,
+                    "process_name": b.process_name,
+                    "end": b.start + b.size
+                }
+                for b in self.blocks
+            ]
+        
+        status["active_processes"] = len(self.process_map)
+        status["fragmentation"] = round(self.get_fragmentation_ratio() * 100, 2)
+        return status
+    
+    def __getstate__(self) -> Dict:
+        """Pickle the blocks as a flat list rather than a deeply nested chain"""
+        state = self.__dict__.copy()
+        # The free bins are keyed by id() and get rebuilt on load
+        del state["_head"], state["_tail"], state["_free_bins"], state["_bin_mask"]
+        state["_blocks"] = self.blocks
+        return state
+    
+    def __setstate__(self, state: Dict):
+        """Restore from a pickle, relinking the blocks in address order"""
+        blocks = state.pop("_blocks")
+        self.__dict__.update(state)
+        self._new_block_list()
+        self._reset_free_bins()
+        for block in blocks:
+            self._link_after(self._tail.prev, block)
+            if block.is_free:
+                self._add_free_block(block)
+    
+    def __copy__(self) -> "ImprovisedMemoryManager":
+        """
+        Copy the manager together with its blocks
+        
+        A shallow copy would relink the original's block objects into the
+        copy's chain, so the blocks are always copied as well.
+        """
+        return copy.deepcopy(self)
     
     def reset(self, new_total_memory: int = None):
         """
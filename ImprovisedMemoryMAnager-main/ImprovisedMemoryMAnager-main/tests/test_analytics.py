@@ -0,0 +1,71 @@
+"""
+Test Suite for Memory Manager Analytics
+Tests workload simulation statistics and comparison plots
+"""
+
+import pytest
+import sys
+import os
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("matplotlib")
+
+# Add parent directory to path to import the analytics module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.buddy_allocator import ImprovisedMemoryManager
+from analytics.compare_policies import (simulate_workload, generate_random_workload,
+                                        analyze_performance, plot_comparison)
+
+
+# ============================================
+# Simulation Tests
+# ============================================
+
+class TestAnalytics:
+    """Test workload simulation statistics"""
+    
+    def test_simulate_workload_large_manager(self):
+        """Test metric arrays widen when memory sizes overflow int32"""
+        manager = ImprovisedMemoryManager(total_memory=2**40)
+        stats = simulate_workload(manager, [('allocate', 'A', 2**35)])
+        
+        assert stats['successful_allocations'] == 1
+        assert stats['used_memory'][0] == 2**35
+        assert stats['free_memory'][0] == 2**40 - 2**35
+    
+    def test_sampled_run_reports_every_operation(self):
+        """Test the report of a strided run matches recording every operation"""
+        np.random.seed(7)
+        operations = generate_random_workload(6000)
+        
+        sampled = simulate_workload(ImprovisedMemoryManager(2048), operations)
+        full = simulate_workload(ImprovisedMemoryManager(2048), operations, sample_every=1)
+        
+        assert len(sampled['fragmentation']) < len(full['fragmentation'])
+        assert analyze_performance(sampled) == analyze_performance(full)
+        assert analyze_performance(full)['max_fragmentation'] == pytest.approx(
+            float(full['fragmentation'].max()))
+    
+    def test_sample_every_must_be_positive(self):
+        """Test a non-positive sampling stride is rejected"""
+        with pytest.raises(ValueError):
+            simulate_workload(ImprovisedMemoryManager(1024), [('allocate', 'A', 100)], sample_every=0)
+    
+    def test_plot_comparison_cache_is_caller_owned(self):
+        """Test comparison figures are only reused through the caller's cache"""
+        stats = simulate_workload(ImprovisedMemoryManager(1024), [('allocate', 'A', 100)])
+        
+        assert plot_comparison(stats, stats) is not plot_comparison(stats, stats)
+        
+        cache = {}
+        fig = plot_comparison(stats, stats, cache)
+        assert plot_comparison(stats, stats, cache) is fig
+
+
+# ============================================
+# Run Tests
+# ============================================
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
@@ -4,6 +4,8 @@ Tests allocation, deallocation, compaction, and edge cases
 """
 
 import pytest
+import pickle
+import copy
 import sys
 import os
 
@@ -81,6 +83,15 @@ class TestAllocation:
         # 100 should be rounded to 128 (next power of 2)
         assert memory_manager.get_used_memory() == 128
     
+    def test_buddy_rounding_boundaries(self):
+        """Test rounding keeps exact powers of 2 and rounds just above them"""
+        manager = ImprovisedMemoryManager(2 ** 60)
+        for name, size, expected in [("A", 1, 1), ("B", 128, 128), ("C", 129, 256),
+                                     ("D", 2 ** 53 + 1, 2 ** 54)]:
+            success, msg, addr = manager.allocate(name, size)
+            assert success is True
+            assert manager.process_map[name].size == expected
+    
     def test_no_buddy_rounding(self, memory_manager):
         """Test allocation without buddy system rounding"""
         success, msg, addr = memory_manager.allocate("Test", 100, use_buddy=False)
@@ -119,6 +130,19 @@ class TestAllocation:
         # Allocate 64KB - should use best fit
         success, msg, addr = memory_manager.allocate("P4", 64, use_buddy=False)
         assert success is True
+    
+    def test_best_fit_picks_smallest_hole(self, memory_manager):
+        """Test that the smallest fitting hole is chosen over a larger one"""
+        memory_manager.allocate("P1", 256, use_buddy=False)
+        memory_manager.allocate("P2", 64, use_buddy=False)
+        memory_manager.allocate("P3", 96, use_buddy=False)
+        memory_manager.allocate("P4", 64, use_buddy=False)
+        memory_manager.deallocate("P1")  # 256KB hole at 0
+        memory_manager.deallocate("P3")  # 96KB hole at 320
+        
+        success, msg, addr = memory_manager.allocate("P5", 80, use_buddy=False)
+        assert success is True
+        assert addr == 320
 
 
 # ============================================
@@ -160,6 +184,40 @@ class TestDeallocation:
         # Should merge blocks, reducing count
         assert block_count_2 < block_count_1
     
+    def test_merge_with_both_neighbours(self, memory_manager):
+        """Test freeing a block between two free blocks merges all three"""
+        memory_manager.allocate("P1", 128)
+        memory_manager.allocate("P2", 128)
+        memory_manager.allocate("P3", 128)
+        memory_manager.allocate("P4", 128)
+        memory_manager.deallocate("P1")
+        memory_manager.deallocate("P3")
+        memory_manager.deallocate("P2")
+        
+        blocks = memory_manager.blocks
+        assert [(b.start, b.size, b.is_free) for b in blocks] == [(0, 384, True), (384, 128, False), (512, 512, True)]
+        for left, right in zip(blocks, blocks[1:]):
+            assert left.next is right and right.prev is left
+    
+    def test_free_zero_size_blocks_at_same_address(self, memory_manager):
+        """Test several free zero-size blocks sharing a start address"""
+        for name in ("A", "B", "C", "D"):
+            memory_manager.allocate(name, 0, use_buddy=False)
+        memory_manager.deallocate("A")
+        memory_manager.deallocate("C")
+        
+        assert memory_manager.get_status()["fragmentation"] == 40.0
+        
+        # Each zero-size free block must be found and removed as itself
+        success, msg, addr = memory_manager.allocate("E", 0, use_buddy=False)
+        assert success is True
+        assert memory_manager.process_map["E"] is memory_manager.blocks[0]
+        
+        restored = pickle.loads(pickle.dumps(memory_manager))
+        assert restored.deallocate("B")[0] is True
+        assert [b.is_free for b in restored.blocks] == [False, True, False, True]
+        assert restored.get_status()["fragmentation"] == 25.0
+    
     def test_deallocate_all(self, populated_manager):
         """Test deallocating all processes"""
         processes = list(populated_manager.process_map.keys())
@@ -216,6 +274,19 @@ class TestCompaction:
         assert success is False
         assert "No allocated blocks" in msg
     
+    def test_compaction_when_already_compact(self, memory_manager):
+        """Test compaction is a no-op on an allocated-prefix, free-suffix layout"""
+        memory_manager.allocate("P1", 100, use_buddy=False)
+        memory_manager.allocate("P2", 200, use_buddy=False)
+        blocks_before = memory_manager.blocks
+        
+        success, msg, moved = memory_manager.compact()
+        
+        assert success is True
+        assert "already compacted" in msg
+        assert moved == 0
+        assert memory_manager.blocks == blocks_before
+    
     def test_compaction_preserves_allocations(self, populated_manager):
         """Test that compaction preserves all allocations"""
         processes_before = set(populated_manager.process_map.keys())
@@ -228,6 +299,23 @@ class TestCompaction:
         
         assert processes_before == processes_after
         assert used_before == used_after
+    
+    def test_compaction_moves_blocks_in_place(self, memory_manager):
+        """Test compaction slides the existing blocks rather than replacing them"""
+        memory_manager.allocate("P1", 100, use_buddy=False)
+        memory_manager.allocate("P2", 200, use_buddy=False)
+        memory_manager.allocate("P3", 50, use_buddy=False)
+        memory_manager.deallocate("P1")
+        p2 = memory_manager.process_map["P2"]
+        
+        success, msg, moved = memory_manager.compact()
+        
+        assert moved == 2
+        assert memory_manager.process_map["P2"] is p2
+        assert p2.start == 0
+        assert memory_manager.process_map["P3"].start == 200
+        assert [b.is_free for b in memory_manager.blocks] == [False, False, True]
+        assert memory_manager.blocks[-1].size == 774
 
 
 # ============================================
@@ -263,6 +351,50 @@ class TestMemoryStatus:
         frag = memory_manager.get_fragmentation_ratio()
         assert frag > 0.0
     
+    def test_snapshot_matches_getters(self, memory_manager):
+        """Test single-pass snapshot agrees with the individual getters"""
+        memory_manager.allocate("P1", 128)
+        memory_manager.allocate("P2", 128)
+        memory_manager.allocate("P3", 128)
+        memory_manager.deallocate("P2")
+        
+        used, free, frag, blocks_count = memory_manager.snapshot()
+        assert used == memory_manager.get_used_memory()
+        assert free == memory_manager.get_free_memory()
+        assert frag == memory_manager.get_fragmentation_ratio()
+        assert blocks_count == len(memory_manager.blocks)
+    
+    def test_get_status_matches_snapshot(self, populated_manager):
+        """Test status totals come from the snapshot"""
+        status = populated_manager.get_status()
+        snapshot = populated_manager.snapshot()
+        
+        assert status["used_memory"] == snapshot.used_memory
+        assert status["free_memory"] == snapshot.free_memory
+        assert status["fragmentation"] == round(snapshot.fragmentation * 100, 2)
+    
+    def test_cached_totals_match_blocks(self, memory_manager):
+        """Test incrementally maintained totals agree with the block list"""
+        memory_manager.allocate("P1", 100, use_buddy=False)
+        memory_manager.allocate("P2", 200, use_buddy=False)
+        memory_manager.allocate("P3", 50, use_buddy=False)
+        memory_manager.allocate("P4", 300, use_buddy=False)
+        memory_manager.deallocate("P2")
+        memory_manager.deallocate("P4")
+        memory_manager.allocate("P5", 64)
+        
+        def assert_totals_consistent():
+            blocks = memory_manager.blocks
+            free_blocks = [b for b in blocks if b.is_free]
+            assert memory_manager.get_used_memory() == sum(b.size for b in blocks if not b.is_free)
+            assert memory_manager.get_free_memory() == sum(b.size for b in free_blocks)
+            expected_frag = (len(free_blocks) - 1) / len(blocks) if len(free_blocks) > 1 else 0.0
+            assert memory_manager.get_fragmentation_ratio() == expected_frag
+        
+        assert_totals_consistent()
+        memory_manager.compact()
+        assert_totals_consistent()
+    
     def test_get_status(self, populated_manager):
         """Test complete status dictionary"""
         status = populated_manager.get_status()
@@ -276,6 +408,16 @@ class TestMemoryStatus:
         
         assert status["total_memory"] == 1024
         assert status["active_processes"] == 3
+    
+    def test_get_status_without_blocks(self, populated_manager):
+        """Test status totals can be fetched without serializing blocks"""
+        status = populated_manager.get_status(include_blocks=False)
+        full_status = populated_manager.get_status()
+        
+        assert "blocks" not in status
+        assert full_status["blocks"] == [b.to_dict() for b in populated_manager.blocks]
+        del full_status["blocks"]
+        assert status == full_status
 
 
 # ============================================
@@ -315,6 +457,48 @@ class TestEdgeCases:
         # Should have fragmented memory
         assert len(memory_manager.blocks) > 1
     
+    def test_pickle_round_trip(self):
+        """Test a fragmented manager survives pickling without deep recursion"""
+        manager = ImprovisedMemoryManager(total_memory=50000)
+        for i in range(5000):
+            manager.allocate(f"P{i}", 10, use_buddy=False)
+        for i in range(0, 5000, 2):
+            manager.deallocate(f"P{i}")
+        
+        restored = pickle.loads(pickle.dumps(manager))
+        
+        assert restored.get_status() == manager.get_status()
+        success, msg = restored.deallocate("P1")
+        assert success is True
+        assert restored.get_used_memory() == manager.get_used_memory() - 10
+    
+    def test_copy_is_independent(self, populated_manager):
+        """Test a copied manager does not share blocks with the original"""
+        clone = copy.copy(populated_manager)
+        
+        populated_manager.allocate("B", 64)
+        clone.deallocate("Process1")
+        
+        assert "B" not in clone.process_map
+        assert "Process1" in populated_manager.process_map
+        assert populated_manager.get_used_memory() == 128 + 256 + 64 + 64
+        assert clone.get_used_memory() == 256 + 64
+        assert sum(b.size for b in populated_manager.blocks) == 1024
+        assert sum(b.size for b in clone.blocks) == 1024
+    
+    def test_non_str_process_names(self, memory_manager):
+        """Test str subclasses and other hashable names can still be allocated"""
+        class Name(str):
+            pass
+        
+        success, msg, addr = memory_manager.allocate(Name("P1"), 64)
+        assert success is True
+        success, msg, addr = memory_manager.allocate(42, 64)
+        assert success is True
+        
+        assert memory_manager.deallocate("P1")[0] is True
+        assert memory_manager.deallocate(42)[0] is True
+    
     def test_reset_functionality(self, populated_manager):
         """Test reset functionality"""
         populated_manager.reset()